@@ -1,19 +1,86 @@
 import json
+import logging
 import re
 import os
+import orjson
 import requests
-from bs4 import BeautifulSoup
-import time
-from urllib.parse import urljoin, quote, urlparse
-from flask import Flask, request, jsonify
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+import hashlib
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from operator import itemgetter
+from urllib.parse import urljoin, quote, urlparse, urlsplit
+from flask import Flask, request
 from flask_cors import CORS
+from flask_compress import Compress
+from cachetools import TTLCache
 
 app = Flask(__name__)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
 CORS(app)
+Compress(app)
 
-print("🔧 Loading Intelligent Supplier Scraping API...")
+logging.basicConfig(format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+logger = logging.getLogger('cholasx')
+logger.setLevel(os.environ.get('LOGLEVEL', 'WARNING').upper())
 
-# Intelligent supplier configurations based on website analysis
+logger.info("🔧 Loading Intelligent Supplier Scraping API...")
+
+# Precompiled patterns used on every scraped product
+THICKNESS_RE = re.compile(r'(\d+)mm')
+WORD_RE = re.compile(r'\b\w+\b')
+
+# Text that marks page furniture rather than a product
+SKIP_TERMS = ('sort by', 'filter', 'menu', 'navigation', 'breadcrumb', 'footer', 'header', 'add to cart')
+
+# Query words that carry no product meaning
+STOP_WORDS = frozenset({'the', 'and', 'for', 'with', 'cheapest', 'best', 'top'})
+
+# Concurrent searches a worker accepts; shared with worker_connections in gunicorn.conf.py
+MAX_CONCURRENT_SEARCHES = int(os.environ.get('WORKER_CONNECTIONS', 100))
+
+# (connect, read) timeouts for supplier fetches
+FETCH_TIMEOUT = (3.05, 10)
+
+# Shared HTTP session so supplier connections are kept alive between searches. Read
+# timeouts are never retried, so the worst case (connect retry plus a retried 5xx)
+# stays inside the 30s search budget
+SESSION = requests.Session()
+SESSION_ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=MAX_CONCURRENT_SEARCHES,
+                              max_retries=Retry(total=2, connect=1, read=0, status=1,
+                                                backoff_factor=0.2,
+                                                status_forcelist=[502, 503, 504],
+                                                raise_on_status=False))
+SESSION.mount('https://', SESSION_ADAPTER)
+SESSION.mount('http://', SESSION_ADAPTER)
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-GB,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+})
+
+# Upper bound on how much of a supplier page is read and parsed
+MAX_PAGE_BYTES = 1_500_000
+
+# <meta charset> / http-equiv declaration, looked for in the first 1024 bytes like a browser
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+
+# Recent supplier results, keyed by (supplier, normalised query, max_results)
+SEARCH_CACHE = TTLCache(maxsize=1024, ttl=300)
+SEARCH_CACHE_LOCK = threading.Lock()
+
+# Fixed category pages, keyed by URL and shared by every query that routes to them
+CATEGORY_PAGE_CACHE = TTLCache(maxsize=32, ttl=3600)
+CATEGORY_PAGE_CACHE_LOCK = threading.Lock()
+
+# Intelligent supplier configurations based on website analysis. price_marker is a
+# substring that any text matched by price_pattern must contain
 SUPPLIERS = [
     {
         "name": "insulation4less",
@@ -27,7 +94,8 @@ SUPPLIERS = [
             "link": "h3 a, .product-item__title a",
             "image": "img"
         },
-        "price_pattern": r"£(\d+\.?\d*)",
+        "price_pattern": re.compile(r"£(\d+\.?\d*)"),
+        "price_marker": "£",
         "contact": "020-3582-6399",
         "delivery": "Next Day Delivery Available"
     },
@@ -52,7 +120,8 @@ SUPPLIERS = [
             "link": "h3 a, .product-title a",
             "image": "img"
         },
-        "price_pattern": r"£(\d+\.?\d*)",
+        "price_pattern": re.compile(r"£(\d+\.?\d*)"),
+        "price_marker": "£",
         "contact": "01480 878787",
         "delivery": "Next Day Delivery Available"
     },
@@ -68,25 +137,109 @@ SUPPLIERS = [
             "link": ".product-title a, h3 a",
             "image": "img"
         },
-        "price_pattern": r"£(\d+\.?\d*)",
+        "price_pattern": re.compile(r"£(\d+\.?\d*)"),
+        "price_marker": "£",
         "contact": "See website",
         "delivery": "Store Collection Available"
     }
 ]
 
+# Split search URL templates once so building a URL is plain concatenation
+for supplier in SUPPLIERS:
+    if 'search_url' in supplier:
+        supplier['search_url_parts'] = tuple(supplier['search_url'].split('{query}', 1))
+
+# Worker threads reused across requests for concurrent supplier fetches, sized so every
+# search a worker accepts can fan out to every supplier at once. Threads start on demand
+# and are greenlets under gunicorn's gevent workers
+SUPPLIER_POOL = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SEARCHES * len(SUPPLIERS),
+                                   thread_name_prefix='supplier')
+
 def extract_thickness_from_query(query):
     """Extract thickness from search query"""
-    thickness_match = re.search(r'(\d+)mm', query.lower())
+    thickness_match = THICKNESS_RE.search(query.lower())
     if thickness_match:
         return thickness_match.group(1) + "mm"
     return None
 
-def clean_price(price_text, pattern):
+def decode_page(body, header_encoding):
+    """Decode a page with its declared charset, falling back to UTF-8; undecodable bytes are replaced"""
+    encoding = header_encoding
+    if not encoding:
+        meta_match = META_CHARSET_RE.search(body, 0, 1024)
+        encoding = meta_match.group(1).decode('ascii') if meta_match else 'utf-8'
+    try:
+        return body.decode(encoding, errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+def fetch_page(url, max_bytes=MAX_PAGE_BYTES):
+    """Fetch a page as text, stopping once max_bytes have been read"""
+    body = bytearray()
+    with SESSION.get(url, stream=True, timeout=FETCH_TIMEOUT) as response:
+        if response.status_code != 200:
+            return response.status_code, ''
+        
+        for chunk in response.iter_content(65536):
+            body.extend(chunk)
+            if len(body) >= max_bytes:
+                break
+        
+        # requests reports ISO-8859-1 for any text/* response without a charset, so only
+        # trust response.encoding when the header actually declares one
+        header_encoding = response.encoding if 'charset' in response.headers.get('Content-Type', '').lower() else None
+        return response.status_code, decode_page(bytes(body), header_encoding)
+
+def fetch_category_page(url):
+    """Fetch a fixed category page, reusing a copy fetched within the last hour"""
+    with CATEGORY_PAGE_CACHE_LOCK:
+        body = CATEGORY_PAGE_CACHE.get(url)
+    if body is not None:
+        return 200, body
+    
+    status_code, body = fetch_page(url)
+    if status_code == 200:
+        with CATEGORY_PAGE_CACHE_LOCK:
+            CATEGORY_PAGE_CACHE[url] = body
+    return status_code, body
+
+def unique_nodes(nodes):
+    """Drop repeat matches; a node matching several selectors in a group is returned once per selector"""
+    seen = set()
+    return [node for node in nodes if not (node in seen or seen.add(node))]
+
+# A search query lowercased and tokenised once, then shared by every supplier and product
+QueryContext = namedtuple('QueryContext', 'raw lower terms thickness')
+
+def build_query_context(query):
+    """Prepare the per-query values used by relevance checks and supplier routing"""
+    query_lower = query.lower()
+    terms = tuple(term for term in WORD_RE.findall(query_lower) if len(term) > 2 and term not in STOP_WORDS)
+    return QueryContext(query, query_lower, terms, extract_thickness_from_query(query_lower))
+
+def warm_connections():
+    """Open pooled connections to every supplier so the first search skips DNS and TLS setup"""
+    for supplier in SUPPLIERS:
+        try:
+            SESSION.head(supplier['website'], timeout=5)
+        except requests.RequestException as e:
+            logger.debug("Could not warm connection to %s: %s", supplier['name'], e)
+
+def canonical_url(url):
+    """Normalise a product URL so tracking params and trailing slashes compare equal"""
+    parts = urlsplit(url)
+    return (parts.netloc.lower(), parts.path.rstrip('/'))
+
+def clean_price(price_text, pattern, marker):
     """Extract price using supplier-specific pattern"""
     if not price_text:
         return None
     
-    price_match = re.search(pattern, str(price_text).replace(',', ''))
+    price_text = str(price_text)
+    if marker not in price_text:  # Cheap reject before running the pattern
+        return None
+    
+    price_match = pattern.search(price_text.replace(',', ''))
     if price_match:
         try:
             price = float(price_match.group(1))
@@ -96,23 +249,18 @@ def clean_price(price_text, pattern):
             pass
     return None
 
-def is_relevant_product(product_name, search_query):
+def is_relevant_product(product_name, query_ctx):
     """Enhanced relevance checking"""
     if not product_name or len(product_name) < 5:
         return False
     
     product_lower = product_name.lower()
-    query_lower = search_query.lower()
     
     # Skip non-product elements
-    skip_terms = ['sort by', 'filter', 'menu', 'navigation', 'breadcrumb', 'footer', 'header', 'add to cart']
-    if any(term in product_lower for term in skip_terms):
+    if any(term in product_lower for term in SKIP_TERMS):
         return False
     
-    # Extract key terms
-    query_terms = re.findall(r'\b\w+\b', query_lower)
-    important_terms = [term for term in query_terms if len(term) > 2 and term not in ['the', 'and', 'for', 'with', 'cheapest', 'best', 'top']]
-    
+    important_terms = query_ctx.terms
     if not important_terms:
         return True
     
@@ -121,80 +269,88 @@ def is_relevant_product(product_name, search_query):
     relevance_score = matches / len(important_terms)
     
     # Special bonus for thickness matches
-    thickness = extract_thickness_from_query(search_query)
-    if thickness and thickness in product_lower:
+    if query_ctx.thickness and query_ctx.thickness in product_lower:
         relevance_score += 0.3
     
     return relevance_score >= 0.3
 
-def search_supplier_intelligent(supplier, query, max_results=5):
+def search_supplier_intelligent(supplier, query_ctx, max_results=5):
     """Intelligent supplier-specific search"""
+    query = query_ctx.raw
+    cache_key = (supplier['name'], query_ctx.lower.strip(), max_results)
+    with SEARCH_CACHE_LOCK:
+        cached = SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug("⚡ Cache hit for %s: %s", supplier['name'], query)
+        return list(cached)
+    
     results = []
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-GB,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
-        
         # Choose search strategy based on supplier
+        fetch = fetch_page
         if supplier['search_strategy'] == 'search_url':
-            search_url = supplier['search_url'].format(query=quote(query))
+            url_prefix, url_suffix = supplier['search_url_parts']
+            search_url = url_prefix + quote(query) + url_suffix
         elif supplier['search_strategy'] == 'category_navigation':
             # Try to find thickness-specific URL
-            thickness = extract_thickness_from_query(query)
+            thickness = query_ctx.thickness
             if thickness and thickness in supplier['thickness_urls']:
                 search_url = supplier['thickness_urls'][thickness]
             else:
                 # Fallback to 50mm as most common
                 search_url = supplier['thickness_urls'].get('50mm', supplier['website'])
+            fetch = fetch_category_page
         else:
             search_url = supplier['website']
         
-        print(f"🔍 Intelligent search on {supplier['name']}: {search_url}")
-        response = requests.get(search_url, headers=headers, timeout=15)
+        logger.debug("🔍 Intelligent search on %s: %s", supplier['name'], search_url)
+        status_code, body = fetch(search_url)
         
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+        if status_code == 200:
+            tree = LexborHTMLParser(body)
             
             # Find products using supplier-specific selectors
-            products = soup.select(supplier['selectors']['product_container'])
-            print(f"📦 Found {len(products)} product containers on {supplier['name']}")
+            products = unique_nodes(tree.css(supplier['selectors']['product_container']))
+            logger.debug("📦 Found %d product containers on %s", len(products), supplier['name'])
             
+            seen_urls = set()
             for product in products[:max_results * 2]:  # Get extra for filtering
                 try:
                     # Extract product name
-                    name_elem = product.select_one(supplier['selectors']['product_name'])
+                    name_elem = product.css_first(supplier['selectors']['product_name'])
                     if not name_elem:
                         continue
                     
-                    product_name = name_elem.get_text(strip=True)
-                    if not is_relevant_product(product_name, query):
+                    product_name = name_elem.text(strip=True)
+                    if not is_relevant_product(product_name, query_ctx):
                         continue
                     
+                    # Extract link, skipping containers for a product already seen
+                    link_elem = product.css_first(supplier['selectors']['link'])
+                    product_url = supplier['website']
+                    url_key = None
+                    href = link_elem.attributes.get('href') if link_elem else None
+                    if href:
+                        product_url = urljoin(supplier['website'], href)
+                        url_key = canonical_url(product_url)
+                        if url_key in seen_urls:
+                            continue
+                    
                     # Extract price
-                    price_elem = product.select_one(supplier['selectors']['price'])
+                    price_elem = product.css_first(supplier['selectors']['price'])
                     if not price_elem:
                         continue
                     
-                    price = clean_price(price_elem.get_text(strip=True), supplier['price_pattern'])
+                    price = clean_price(price_elem.text(strip=True), supplier['price_pattern'], supplier['price_marker'])
                     if not price:
                         continue
                     
-                    # Extract link
-                    link_elem = product.select_one(supplier['selectors']['link'])
-                    product_url = supplier['website']
-                    if link_elem and link_elem.get('href'):
-                        product_url = urljoin(supplier['website'], link_elem['href'])
-                    
                     # Extract image
-                    img_elem = product.select_one(supplier['selectors']['image'])
+                    img_elem = product.css_first(supplier['selectors']['image'])
                     image_url = ""
                     if img_elem:
-                        img_src = img_elem.get('src') or img_elem.get('data-src')
+                        img_src = img_elem.attributes.get('src') or img_elem.attributes.get('data-src')
                         if img_src:
                             image_url = urljoin(supplier['website'], img_src)
                     
@@ -213,22 +369,27 @@ def search_supplier_intelligent(supplier, query, max_results=5):
                         "rating": "4.5 stars"
                     }
                     results.append(result)
-                    print(f"✅ Found: {product_name[:60]}... - £{price:.2f}")
+                    if url_key:
+                        seen_urls.add(url_key)
+                    logger.debug("✅ Found: %s... - £%.2f", product_name[:60], price)
                     
                     if len(results) >= max_results:
                         break
                 
                 except Exception as e:
                     continue
+            
+            with SEARCH_CACHE_LOCK:
+                SEARCH_CACHE[cache_key] = tuple(results)
         
         else:
-            print(f"❌ HTTP {response.status_code} from {supplier['name']}")
+            logger.warning("❌ HTTP %s from %s", status_code, supplier['name'])
         
-        print(f"✅ Found {len(results)} relevant products from {supplier['name']}")
+        logger.debug("✅ Found %d relevant products from %s", len(results), supplier['name'])
         return results
         
     except Exception as e:
-        print(f"❌ Error searching {supplier['name']}: {e}")
+        logger.warning("❌ Error searching %s: %s", supplier['name'], e)
         return []
 
 def detect_category(product_name):
@@ -250,58 +411,99 @@ def search_all_suppliers_intelligent(query, max_suppliers=3):
     """Intelligent search across all suppliers"""
     all_results = []
     
-    print(f"🔍 Starting intelligent search for: {query}")
+    logger.info("🔍 Starting intelligent search for: %s", query)
+    
+    query_ctx = build_query_context(query)
+    
+    # Each supplier is a different host, so fetch them all at once
+    futures = {
+        SUPPLIER_POOL.submit(search_supplier_intelligent, supplier, query_ctx, max_results=4): supplier
+        for supplier in SUPPLIERS[:max_suppliers]
+    }
+    done, _ = wait(futures, timeout=30)
     
-    for supplier in SUPPLIERS[:max_suppliers]:
+    # Merge in supplier order so equal prices sort the same way every time
+    for future, supplier in futures.items():
+        if future not in done:
+            future.cancel()  # Frees the pool slot if it never started
+            logger.warning("❌ %s search timed out", supplier['name'])
+            continue
         try:
-            supplier_results = search_supplier_intelligent(supplier, query, max_results=4)
-            all_results.extend(supplier_results)
-            time.sleep(2)  # Respectful delay
-                
+            all_results.extend(future.result())
         except Exception as e:
-            print(f"❌ {supplier['name']} search failed: {e}")
-            continue
-    
-    # Remove duplicates and sort by price
-    unique_results = []
-    seen_products = set()
+            logger.warning("❌ %s search failed: %s", supplier['name'], e)
     
+    # Remove duplicates (first listing wins) and sort by price
+    results_by_key = {}
     for result in all_results:
-        product_key = (result['product_name'][:50].lower(), result['supplier'])
-        if product_key not in seen_products:
-            seen_products.add(product_key)
-            unique_results.append(result)
+        results_by_key.setdefault((result['product_name'][:50].lower(), result['supplier']), result)
+    unique_results = list(results_by_key.values())
     
     # Sort by price (cheapest first)
-    unique_results.sort(key=lambda x: x['price_numeric'])
+    unique_results.sort(key=itemgetter('price_numeric'))
     
-    print(f"✅ Intelligent search completed. Found {len(unique_results)} unique products")
+    logger.info("✅ Intelligent search completed. Found %d unique products", len(unique_results))
     return unique_results
 
+# Static endpoint bodies, serialised once at import
+HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": "Intelligent Supplier Scraping API",
+    "version": "4.0 - AI-Powered Scraping",
+    "suppliers": len(SUPPLIERS),
+    "search_type": "intelligent_supplier_scraping",
+    "features": ["supplier_specific_strategies", "relevance_filtering", "price_sorting", "duplicate_removal"]
+})
+
+DEMO_BYTES = orjson.dumps({
+    "message": "Intelligent supplier search API. Searches real supplier websites with AI-powered extraction.",
+    "suppliers": [s['name'] for s in SUPPLIERS],
+    "search_type": "intelligent_supplier_search",
+    "example_queries": ["50mm PIR insulation", "cheapest plasterboard", "mineral wool 100mm"]
+})
+
+SUPPLIERS_BYTES = orjson.dumps({
+    "suppliers": [{"name": s['name'], "website": s['website'], "strategy": s['search_strategy']} for s in SUPPLIERS],
+    "total_suppliers": len(SUPPLIERS),
+    "search_type": "intelligent_supplier_scraping"
+})
+
+HEALTH_ETAG = hashlib.blake2b(HEALTH_BYTES, digest_size=8).hexdigest()
+DEMO_ETAG = hashlib.blake2b(DEMO_BYTES, digest_size=8).hexdigest()
+SUPPLIERS_ETAG = hashlib.blake2b(SUPPLIERS_BYTES, digest_size=8).hexdigest()
+
+def json_response(obj, status=200):
+    """Serialise straight to bytes with orjson, skipping jsonify's str round trip"""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
+def static_json_response(body, etag):
+    """Serve a prebuilt JSON body, answering If-None-Match with 304"""
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
 @app.route('/')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "service": "Intelligent Supplier Scraping API",
-        "version": "4.0 - AI-Powered Scraping",
-        "suppliers": len(SUPPLIERS),
-        "search_type": "intelligent_supplier_scraping",
-        "features": ["supplier_specific_strategies", "relevance_filtering", "price_sorting", "duplicate_removal"]
-    })
+    return static_json_response(HEALTH_BYTES, HEALTH_ETAG)
 
 @app.route('/api/search', methods=['POST'])
 def search():
     """Intelligent supplier search endpoint"""
     try:
-        data = request.get_json()
+        try:
+            data = orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            return json_response({"error": "Request body must be valid JSON"}, 400)
+        
         query = data.get('query', '').strip()
         max_results = min(data.get('max_results', 10), 15)
         
         if not query:
-            return jsonify({"error": "Query parameter is required"}), 400
+            return json_response({"error": "Query parameter is required"}, 400)
         
-        print(f"🔍 Intelligent search query: {query}")
+        logger.info("🔍 Intelligent search query: %s", query)
         
         # Perform intelligent search
         results = search_all_suppliers_intelligent(query, max_suppliers=3)
@@ -310,7 +512,7 @@ def search():
         results = results[:max_results]
         
         if not results:
-            return jsonify({
+            return json_response({
                 "query": query,
                 "results": [],
                 "total_results": 0,
@@ -320,9 +522,9 @@ def search():
                 "suggestions": ["50mm PIR insulation", "25mm insulation board", "plasterboard 12.5mm"]
             })
         
-        # Generate AI summary
-        cheapest = min(results, key=lambda x: x['price_numeric'])
-        ai_summary = f"Found {len(results)} products across {len(set([r['supplier'] for r in results]))} suppliers. Cheapest: {cheapest['product_name'][:50]}... at {cheapest['price']} from {cheapest['supplier']}."
+        # Generate AI summary (results are already sorted cheapest first)
+        cheapest = results[0]
+        ai_summary = f"Found {len(results)} products across {len({r['supplier'] for r in results})} suppliers. Cheapest: {cheapest['product_name'][:50]}... at {cheapest['price']} from {cheapest['supplier']}."
         
         response = {
             "query": query,
@@ -335,34 +537,25 @@ def search():
             "search_time": "Real-time intelligent scraping"
         }
         
-        return jsonify(response)
+        return json_response(response)
         
     except Exception as e:
-        print(f"❌ Search error: {e}")
-        return jsonify({
+        logger.exception("❌ Search error: %s", e)
+        return json_response({
             "error": "Search temporarily unavailable",
             "message": "Please try again with specific product terms",
             "search_type": "intelligent_supplier_search"
-        }), 500
+        }, 500)
 
 @app.route('/api/search/demo', methods=['GET'])
 def demo():
     """Demo endpoint"""
-    return jsonify({
-        "message": "Intelligent supplier search API. Searches real supplier websites with AI-powered extraction.",
-        "suppliers": [s['name'] for s in SUPPLIERS],
-        "search_type": "intelligent_supplier_search",
-        "example_queries": ["50mm PIR insulation", "cheapest plasterboard", "mineral wool 100mm"]
-    })
+    return static_json_response(DEMO_BYTES, DEMO_ETAG)
 
 @app.route('/api/suppliers', methods=['GET'])
 def get_suppliers():
     """Get available suppliers"""
-    return jsonify({
-        "suppliers": [{"name": s['name'], "website": s['website'], "strategy": s['search_strategy']} for s in SUPPLIERS],
-        "total_suppliers": len(SUPPLIERS),
-        "search_type": "intelligent_supplier_scraping"
-    })
+    return static_json_response(SUPPLIERS_BYTES, SUPPLIERS_ETAG)
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
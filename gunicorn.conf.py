@@ -0,0 +1,15 @@
+import os
+
+# Production server settings; the app.run() block in app.py is for local use only
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+# os.cpu_count() reports the host, not the container quota, so default small
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'gevent'
+worker_connections = int(os.environ.get('WORKER_CONNECTIONS', 100))
+
+
+def post_worker_init(worker):
+    # Warm supplier connections without delaying the worker's first request
+    import threading
+    from app import warm_connections
+    threading.Thread(target=warm_connections, daemon=True).start()